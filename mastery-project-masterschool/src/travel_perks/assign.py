@@ -11,6 +11,7 @@ from __future__ import annotations
 import logging
 from typing import Dict
 
+import numpy as np
 import pandas as pd
 
 
@@ -42,13 +43,40 @@ def assign_perks(features: pd.DataFrame, mapping: Dict[int, str] = DEFAULT_PERK_
     #   ``cluster_id`` column. It first checks that the column exists and
     #   then uses the mapping dictionary (either the default or a custom
     #   provided mapping) to translate cluster indices into descriptive
-    #   perk labels. If a cluster is not found in the mapping the perk
-    #   defaults to ``"Unknown"``. The function returns a copy of the
-    #   input DataFrame to preserve immutability of upstream data.
+    #   perk labels. Cluster indices are small contiguous integers, so the
+    #   mapping is materialised once as a lookup array and the perk column
+    #   is produced by a single vectorised gather instead of a per-row
+    #   dictionary lookup. If a cluster is not found in the mapping the
+    #   perk defaults to ``"Unknown"``.
     logger = logging.getLogger(__name__)
     if "cluster_id" not in features.columns:
         raise ValueError("cluster_id column missing from features")
-    features_with_perk = features.copy()
-    features_with_perk["perk"] = features_with_perk["cluster_id"].map(mapping).fillna("Unknown")
+    # A shallow copy shares the existing column buffers; only the new
+    # perk column allocates memory. The input frame is never mutated.
+    features_with_perk = features.copy(deep=False)
+    if not mapping:
+        features_with_perk["perk"] = "Unknown"
+    elif min(mapping) < 0:
+        # Negative cluster ids cannot index the lookup table; mappings that
+        # use them take the dictionary path instead of being dropped.
+        features_with_perk["perk"] = (
+            features["cluster_id"].map(mapping).fillna("Unknown").to_numpy()
+        )
+    else:
+        # Build a small lookup table indexed by cluster id; clusters outside
+        # the mapping (or negative ids) fall back to "Unknown".
+        lut = np.array(
+            [mapping.get(i, "Unknown") for i in range(max(mapping) + 1)], dtype=object
+        )
+        codes = features["cluster_id"].to_numpy()
+        if not np.issubdtype(codes.dtype, np.integer):
+            # Frames read back from disk may carry float codes with NaN for
+            # unclustered rows; map missing values out of range so they fall
+            # back to "Unknown" instead of breaking the integer gather.
+            codes = np.where(pd.isna(codes), -1, codes).astype("int64")
+        in_range = (codes >= 0) & (codes < len(lut))
+        features_with_perk["perk"] = np.where(
+            in_range, lut[np.where(in_range, codes, 0)], "Unknown"
+        )
     logger.info("Assigned perks based on cluster mapping")
     return features_with_perk
\ No newline at end of file
@@ -1,12 +1,14 @@
 """Configuration management for the Travel Perks pipeline.
 
-This module defines a :class:`Settings` class based on Pydantic's
-``BaseSettings`` which reads configuration from environment variables,
-defaults and optional YAML files. Keeping configuration external to
-the code base is a core practice of the Twelve‑Factor App philosophy
-【599210147542025†L10-L43】. Environment variables allow you to change
-resource handles, input URLs or thresholds without modifying code or
-checking secrets into version control.
+This module defines a :class:`Settings` dataclass which reads
+configuration from environment variables and defaults. Keeping
+configuration external to the code base is a core practice of the
+Twelve‑Factor App philosophy【599210147542025†L10-L43】. Environment
+variables allow you to change resource handles, input URLs or
+thresholds without modifying code or checking secrets into version
+control. A plain dataclass keeps CLI cold start fast: the settings
+object is built from ``os.environ`` reads without importing a model
+framework.
 
 You can supply configuration via the ``TRAVEL_PERKS_*`` environment
 variables or override values on the CLI. See ``travel_perks.cli`` for
@@ -15,13 +17,30 @@ command‑line usage.
 
 from __future__ import annotations
 
+import os
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
 
-from pydantic import BaseSettings, Field, validator
+_ENV_PREFIX = "TRAVEL_PERKS_"
 
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
 
-class Settings(BaseSettings):
+
+def _env(name: str, default: str) -> str:
+    """Read ``TRAVEL_PERKS_<name>`` from the environment, falling back to a default."""
+    return os.environ.get(_ENV_PREFIX + name, default)
+
+
+def _as_bool(value) -> bool:
+    """Coerce an environment string (or bool) to a boolean."""
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in _TRUTHY
+
+
+@dataclass
+class Settings:
     """Application settings loaded from environment variables.
 
     Attributes
@@ -55,62 +74,80 @@ class Settings(BaseSettings):
     seed: int
         Random seed used for reproducible clustering. Determinism is
         important for reliable behaviour across runs【952685827302670†L49-L58】.
+    use_sklearnex: bool
+        When ``True``, the pipeline attempts to patch scikit-learn with
+        the Intel extension (``sklearnex``) before clustering. The
+        extension is optional; when it is not installed the stock
+        scikit-learn implementation is used and a warning is logged.
+    gold_format: str
+        File format for the gold features table: ``parquet`` (smallest
+        on disk), ``feather`` (fastest reload) or ``csv``.
     """
 
     # Input data
-    users_url: str = Field(
-        default="https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_users_export_2025-04-01_101058.csv",
-        description="URL for the raw users CSV",
+    users_url: str = field(
+        default_factory=lambda: _env(
+            "USERS_URL",
+            "https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_users_export_2025-04-01_101058.csv",
+        )
     )
-    sessions_url: str = Field(
-        default="https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_sessions_export_2025-03-31_221253.csv",
-        description="URL for the raw sessions CSV",
+    sessions_url: str = field(
+        default_factory=lambda: _env(
+            "SESSIONS_URL",
+            "https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_sessions_export_2025-03-31_221253.csv",
+        )
     )
-    flights_url: str = Field(
-        default="https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_flights_export_2025-03-31_134734.csv",
-        description="URL for the raw flights CSV",
+    flights_url: str = field(
+        default_factory=lambda: _env(
+            "FLIGHTS_URL",
+            "https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_flights_export_2025-03-31_134734.csv",
+        )
     )
-    hotels_url: str = Field(
-        default="https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_hotels_export_2025-03-31_171805.csv",
-        description="URL for the raw hotels CSV",
+    hotels_url: str = field(
+        default_factory=lambda: _env(
+            "HOTELS_URL",
+            "https://lakehouse-masteryproject-2025.s3.eu-north-1.amazonaws.com/bronze/public_hotels_export_2025-03-31_171805.csv",
+        )
     )
 
     # Cohort filtering
-    min_sessions: int = Field(7, description="Minimum sessions threshold for cohort filtering")
-    start_date: str = Field("2023-01-04", description="Start date for cohort filtering (inclusive)")
+    min_sessions: int = field(default_factory=lambda: _env("MIN_SESSIONS", "7"))  # type: ignore[assignment]
+    start_date: str = field(default_factory=lambda: _env("START_DATE", "2023-01-04"))
 
     # Paths
-    output_dir: Path = Field(Path("data/outputs"), description="Path to output directory")
-    gold_dir: Path = Field(Path("data/gold"), description="Path to gold feature directory")
-    logs_dir: Path = Field(Path("logs"), description="Path to log directory")
+    output_dir: Path = field(default_factory=lambda: _env("OUTPUT_DIR", "data/outputs"))  # type: ignore[assignment]
+    gold_dir: Path = field(default_factory=lambda: _env("GOLD_DIR", "data/gold"))  # type: ignore[assignment]
+    logs_dir: Path = field(default_factory=lambda: _env("LOGS_DIR", "logs"))  # type: ignore[assignment]
 
     # Execution behaviour
-    run_id: Optional[str] = Field(None, description="Unique identifier for the current run")
-    dry_run: bool = Field(False, description="If true, do not write outputs to disk")
-    seed: int = Field(42, description="Random seed for deterministic behaviour")
-
-    class Config:
-        env_prefix = "TRAVEL_PERKS_"
-        case_sensitive = False
+    run_id: Optional[str] = field(default_factory=lambda: os.environ.get(_ENV_PREFIX + "RUN_ID"))
+    dry_run: bool = field(default_factory=lambda: _env("DRY_RUN", "false"))  # type: ignore[assignment]
+    seed: int = field(default_factory=lambda: _env("SEED", "42"))  # type: ignore[assignment]
+    use_sklearnex: bool = field(default_factory=lambda: _env("USE_SKLEARNEX", "false"))  # type: ignore[assignment]
+    gold_format: str = field(default_factory=lambda: _env("GOLD_FORMAT", "parquet"))
 
-    @validator("start_date")
-    def validate_date(cls, v: str) -> str:  # noqa: D417
-        """Validate that the start date is in ISO format.
-
-        A simple string check is sufficient here because parsing will
-        occur later in the pipeline using pandas.
-        """
+    def __post_init__(self) -> None:
         # Notes:
-        #   Validators in Pydantic allow custom pre‑ or post‑processing
-        #   of field values. This validator ensures the `start_date`
-        #   attribute conforms to the `YYYY-MM-DD` format by checking
-        #   delimiters and length. It does not parse the date; full
-        #   parsing is deferred to pandas which provides robust date
-        #   handling. Raising a ``ValueError`` triggers a validation
-        #   error on the settings object if the format is invalid.
+        #   Environment variables and JSON configuration files deliver
+        #   strings, so the declared field types are enforced here once
+        #   per construction. The ``start_date`` check mirrors the old
+        #   Pydantic validator: it confirms the `YYYY-MM-DD` shape but
+        #   defers full parsing to pandas, which provides robust date
+        #   handling. A ``ValueError`` is raised if the format is
+        #   invalid.
+        self.min_sessions = int(self.min_sessions)
+        self.seed = int(self.seed)
+        self.output_dir = Path(self.output_dir)
+        self.gold_dir = Path(self.gold_dir)
+        self.logs_dir = Path(self.logs_dir)
+        self.dry_run = _as_bool(self.dry_run)
+        self.use_sklearnex = _as_bool(self.use_sklearnex)
+        self.gold_format = str(self.gold_format).strip().lower()
+        if self.gold_format not in ("parquet", "feather", "csv"):
+            raise ValueError("gold_format must be one of 'parquet', 'feather' or 'csv'")
+        v = self.start_date
         if len(v) != 10 or v[4] != "-" or v[7] != "-":
             raise ValueError("start_date must be in YYYY-MM-DD format")
-        return v
 
     def ensure_directories(self) -> None:
         """Ensure that output, gold and logs directories exist.
@@ -122,12 +159,11 @@ class Settings(BaseSettings):
         """
         # Notes:
         #   This method iterates over the configured directory paths
-        #   (``output_dir``, ``gold_dir`` and ``logs_dir``) and
-        #   invokes ``mkdir`` with ``parents=True`` and
-        #   ``exist_ok=True``. This creates the directory hierarchy if
-        #   it does not already exist and prevents errors on
-        #   subsequent writes. It enables idempotent pipeline runs
-        #   across different environments where directories may be
-        #   absent initially.
-        for path in [self.output_dir, self.gold_dir, self.logs_dir]:
-            path.mkdir(parents=True, exist_ok=True)
\ No newline at end of file
+        #   (``output_dir``, ``gold_dir`` and ``logs_dir``) and invokes
+        #   ``os.makedirs`` with ``exist_ok=True``. This creates each
+        #   directory hierarchy in one call if it does not already
+        #   exist and prevents errors on subsequent writes. It enables
+        #   idempotent pipeline runs across different environments
+        #   where directories may be absent initially.
+        for path in (self.output_dir, self.gold_dir, self.logs_dir):
+            os.makedirs(path, exist_ok=True)
@@ -12,30 +12,161 @@ idempotent pipeline runs.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict
+from typing import Dict, FrozenSet, Optional
 
 import pandas as pd
 import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 
-def read_csv(url: str, retries: int = 3, timeout: int = 30) -> pd.DataFrame:
+# Shared HTTP session with connection pooling and keep-alive: the four bronze
+# CSVs live on the same S3 host, so reusing one TLS connection saves a
+# handshake per file. Transient 5xx responses and connection errors are
+# retried with exponential backoff by urllib3 instead of a handwritten loop.
+_RETRIES = 3
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=_RETRIES, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+    ),
+)
+_SESSION = requests.Session()
+_SESSION.mount("https://", _ADAPTER)
+_SESSION.mount("http://", _ADAPTER)
+
+
+# Narrow dtypes for the known bronze columns. Defaults (int64/float64) double
+# the memory bandwidth of every downstream scan for no benefit at this scale;
+# keys missing from a given CSV are ignored by the pandas parser.
+_DTYPES: Dict[str, Dict[str, str]] = {
+    "users": {"user_id": "int32"},
+    "sessions": {"user_id": "int32"},
+    "flights": {"user_id": "int32", "discount_amount": "float32", "total_amount": "float32"},
+    "hotels": {"user_id": "int32", "discount_amount": "float32", "total_amount": "float32"},
+}
+
+# Columns the pipeline actually consumes per bronze table, plus each table's
+# primary key (session_id / trip_id). The keys are not aggregated themselves,
+# but they must survive the projection so that clean_tables' drop_duplicates
+# still distinguishes records that merely coincide on the feature columns;
+# without them, distinct sessions or bookings would collapse and undercount
+# the per-user totals. Everything else is projected out at parse time, saving
+# parser CPU and downstream memory. The sets are applied as a callable usecols
+# filter, so columns listed here but absent from a given export are simply
+# ignored.
+_USECOLS: Dict[str, FrozenSet[str]] = {
+    "users": frozenset({"user_id"}),
+    "sessions": frozenset(
+        {"session_id", "user_id", "session_start", "session_end", "timestamp"}
+    ),
+    "flights": frozenset(
+        {
+            "trip_id",
+            "user_id",
+            "discount_amount",
+            "total_amount",
+            "departure_date",
+            "arrival_date",
+            "booking_date",
+            "check_in",
+            "check_out",
+        }
+    ),
+    "hotels": frozenset(
+        {
+            "trip_id",
+            "user_id",
+            "check_in",
+            "check_out",
+            "booking_date",
+            "discount_amount",
+            "total_amount",
+        }
+    ),
+}
+
+# An object column qualifies as categorical when its cardinality is well below
+# the row count; the dictionary encoding then shrinks memory and speeds up
+# later groupby/map operations.
+_CATEGORY_MAX_RATIO = 0.5
+
+# Date columns are re-parsed to datetime64 immediately in clean_tables, so
+# dictionary-encoding their strings is wasted work — and actively harmful:
+# pd.to_datetime hands categorical input back as a categorical with datetime
+# categories, which breaks the comparisons and arithmetic downstream of the
+# parse. Day-granularity dates repeat heavily enough to pass the cardinality
+# test, so they are excluded by name.
+_DATE_COLS: FrozenSet[str] = frozenset(
+    {
+        "session_start",
+        "session_end",
+        "timestamp",
+        "departure_date",
+        "arrival_date",
+        "booking_date",
+        "check_in",
+        "check_out",
+    }
+)
+
+
+def _categorize_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Convert low-cardinality string columns to the ``category`` dtype.
+
+    Known date columns are skipped: they are parsed to ``datetime64``
+    right after ingest and must stay plain strings until then.
+    """
+    for col in df.columns:
+        if col in _DATE_COLS:
+            continue
+        if df[col].dtype == object and len(df) > 0:
+            if df[col].nunique(dropna=True) <= _CATEGORY_MAX_RATIO * len(df):
+                df[col] = df[col].astype("category")
+    return df
+
+
+def read_csv(
+    url: str,
+    timeout: int = 30,
+    cache_dir: Optional[Path] = None,
+    dtype: Optional[Dict[str, str]] = None,
+    categorize: bool = False,
+    usecols: Optional[FrozenSet[str]] = None,
+) -> pd.DataFrame:
     """Load a CSV from a given HTTP/S URL using pandas.
 
-    This function implements a simple retry mechanism: if a transient
-    network error occurs (e.g. status codes 5xx or connection timeouts),
-    it will retry up to ``retries`` times. Client errors (e.g. 4xx)
-    are considered fatal and will be raised immediately.
+    Transient network errors (status codes 5xx or connection timeouts)
+    are retried with exponential backoff by the shared session's
+    ``urllib3.Retry`` configuration. Client errors (e.g. 4xx) are
+    considered fatal and will be raised immediately.
 
     Parameters
     ----------
     url: str
         The fully qualified URL pointing to the CSV resource.
-    retries: int, default 3
-        Number of times to retry on transient failures.
     timeout: int, default 30
         Timeout in seconds for the HTTP request.
+    cache_dir: pathlib.Path, optional
+        When provided, downloads are cached on disk as Parquet files
+        keyed by a hash of the URL. Subsequent calls for the same URL
+        skip the network and CSV parse entirely. Delete the directory
+        to force a fresh download.
+    dtype: dict, optional
+        Column dtype hints forwarded to ``pandas.read_csv`` so parsing
+        is single-pass and columns land in narrow types directly.
+    categorize: bool, default False
+        When ``True``, low-cardinality string columns are converted to
+        the pandas ``category`` dtype after parsing.
+    usecols: frozenset, optional
+        When provided, only these columns are parsed; names not present
+        in the CSV are ignored rather than raising.
 
     Returns
     -------
@@ -44,42 +175,63 @@ def read_csv(url: str, retries: int = 3, timeout: int = 30) -> pd.DataFrame:
     """
     # Notes:
     #   This function wraps a typical ``pandas.read_csv`` call with
-    #   retry logic and explicit HTTP error handling. It first
-    #   attempts to download the resource using the ``requests``
-    #   library. If the server returns a 5xx error the request is
-    #   retried up to the specified number of attempts. A 4xx error
-    #   raises immediately since the client request is invalid. On
-    #   success the bytes are streamed into pandas via a BytesIO
-    #   object. Logging is used throughout to track attempts and
-    #   failures.
+    #   explicit HTTP error handling. It opens a streaming download on
+    #   the shared pooled session so that pandas' C parser can consume
+    #   bytes as they arrive instead of buffering the whole payload in
+    #   memory first. Transient failures are retried inside urllib3 via
+    #   the session adapter; a 4xx response raises immediately since
+    #   the client request is invalid. Non-HTTP URLs (e.g. ``file://``
+    #   or local paths) are handed straight to pandas.
     logger = logging.getLogger(__name__)
-    attempt = 0
-    while True:
-        attempt += 1
+    usecols_filter = (lambda c: c in usecols) if usecols is not None else None
+    if not url.startswith(("http://", "https://")):
+        # requests only speaks HTTP; let pandas handle local paths and file URIs
+        df = pd.read_csv(url, dtype=dtype, usecols=usecols_filter)
+        return _categorize_strings(df) if categorize else df
+    cache_path: Optional[Path] = None
+    if cache_dir is not None:
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        cache_path = cache_dir / f"{key}.parquet"
+        if cache_path.exists():
+            logger.info("Loading %s from cache %s", url, cache_path)
+            return pd.read_parquet(cache_path)
+    for attempt in range(1, _RETRIES + 1):
         try:
             # Use requests to precheck the response to avoid pandas mis‑reporting 403s
-            resp = requests.get(url, timeout=timeout)
-            if resp.status_code >= 500 and attempt <= retries:
-                logger.warning(
-                    "Transient server error %s on %s (attempt %s/%s)",
-                    resp.status_code,
-                    url,
-                    attempt,
-                    retries,
-                )
-                continue
+            resp = _SESSION.get(url, stream=True, timeout=timeout)
             resp.raise_for_status()
-            # Pass content bytes to pandas
-            from io import BytesIO
-
-            return pd.read_csv(BytesIO(resp.content))
+            # Let pandas parse directly from the response stream; decoding
+            # gzip/deflate transfer encodings is delegated to urllib3.
+            resp.raw.decode_content = True
+            df = pd.read_csv(resp.raw, dtype=dtype, usecols=usecols_filter)
+            break
         except (requests.exceptions.RequestException, pd.errors.ParserError) as exc:
-            if attempt >= retries:
-                logger.error("Failed to load CSV from %s after %s attempts: %s", url, attempt, exc)
+            logger.error("Failed to load CSV from %s: %s", url, exc)
+            raise
+        except urllib3.exceptions.HTTPError as exc:
+            # Failures after the headers arrive (connection reset while
+            # pandas consumes the body) surface as raw urllib3 errors that
+            # neither requests nor the adapter's Retry covers, so the
+            # download is re-requested here a bounded number of times.
+            if attempt == _RETRIES:
+                logger.error(
+                    "Failed to stream CSV from %s after %s attempts: %s", url, attempt, exc
+                )
                 raise
             logger.warning(
-                "Error reading %s on attempt %s/%s: %s – retrying", url, attempt, retries, exc
+                "Transient failure streaming %s (attempt %s/%s): %s",
+                url,
+                attempt,
+                _RETRIES,
+                exc,
             )
+    if categorize:
+        df = _categorize_strings(df)
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, compression="zstd", index=False)
+        logger.info("Cached %s at %s", url, cache_path)
+    return df
 
 
 def write_csv(df: pd.DataFrame, path: Path) -> None:
@@ -103,6 +255,24 @@ def write_csv(df: pd.DataFrame, path: Path) -> None:
     df.to_csv(path, index=False)
 
 
+def write_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write a DataFrame to disk as zstd-compressed Parquet.
+
+    Used for internal (gold layer) artifacts where a columnar binary
+    format is both faster to write and far faster to re-read than CSV.
+    Customer-facing outputs stay CSV.
+
+    Parameters
+    ----------
+    df: pandas.DataFrame
+        The DataFrame to write.
+    path: pathlib.Path
+        Destination path for the Parquet file.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    df.to_parquet(path, compression="zstd", index=False)
+
+
 def load_raw_data(settings: "Settings") -> Dict[str, pd.DataFrame]:  # noqa: F821
     """Load all raw datasets specified in the settings.
 
@@ -121,22 +291,36 @@ def load_raw_data(settings: "Settings") -> Dict[str, pd.DataFrame]:  # noqa: F82
         Dictionary mapping table names to DataFrames.
     """
     # Notes:
-    #   By iterating over the URLs defined in the Settings object,
-    #   this function downloads each CSV via ``read_csv``, logs
-    #   progress and builds a dictionary keyed by logical table name.
-    #   If any dataset fails to download after retries the exception
-    #   bubbles up and stops the pipeline, providing fail‑fast
-    #   behaviour.
+    #   The four downloads are independent network calls, so they are
+    #   dispatched concurrently on a small thread pool rather than in a
+    #   serial loop; ingest wall time then tracks the slowest download
+    #   instead of the sum of all four. Retry handling stays inside
+    #   ``read_csv``. If any dataset fails to download after retries the
+    #   exception bubbles up via ``Future.result`` and stops the
+    #   pipeline, providing fail‑fast behaviour.
     logger = logging.getLogger(__name__)
     logger.info("Loading raw datasets from configured URLs")
-    data = {}
-    for name, url in {
+    urls = {
         "users": settings.users_url,
         "sessions": settings.sessions_url,
         "flights": settings.flights_url,
         "hotels": settings.hotels_url,
-    }.items():
-        logger.info("Loading %s from %s", name, url)
-        data[name] = read_csv(url)
-        logger.info("Loaded %s with %s records", name, len(data[name]))
+    }
+    # Dry runs must not persist anything, including the download cache.
+    cache_dir = None if settings.dry_run else settings.gold_dir / "_cache"
+    with ThreadPoolExecutor(max_workers=len(urls)) as executor:
+        futures = {
+            name: executor.submit(
+                read_csv,
+                url,
+                cache_dir=cache_dir,
+                dtype=_DTYPES.get(name),
+                categorize=True,
+                usecols=_USECOLS.get(name),
+            )
+            for name, url in urls.items()
+        }
+        data = {name: future.result() for name, future in futures.items()}
+    for name, df in data.items():
+        logger.info("Loaded %s with %s records", name, len(df))
     return data
\ No newline at end of file
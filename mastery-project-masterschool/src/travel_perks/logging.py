@@ -5,7 +5,8 @@ The logging setup implemented here builds upon the standard Python
 documentation on logging best practices【713027300398110†L114-L151】. Each
 log entry is serialized as a JSON object containing a timestamp,
 severity level, logger name and message. Additional contextual fields
-such as a run identifier can be attached via a ``LoggerAdapter``.
+such as a run identifier are attached via a ``logging.Filter`` on the
+handlers, which keeps the plain ``Logger`` in the hot path.
 
 The JSON formatter facilitates ingestion into log aggregation systems
 and simplifies downstream parsing for observability and metrics. Users
@@ -18,9 +19,45 @@ from __future__ import annotations
 import json
 import logging
 import sys
-from datetime import datetime
+import time
 from typing import Any, Dict, Optional
 
+try:  # orjson serializes roughly 3-10x faster than the stdlib encoder
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+# Standard LogRecord attributes that carry no analytical value in the JSON
+# output. Hoisted to module level so the membership test in the formatter is
+# a single frozenset lookup per attribute instead of rebuilding the set on
+# every record.
+_RESERVED = frozenset(
+    {
+        "args",
+        "msg",
+        "message",
+        "name",
+        "levelname",
+        "levelno",
+        "pathname",
+        "filename",
+        "module",
+        "exc_info",
+        "exc_text",
+        "stack_info",
+        "lineno",
+        "funcName",
+        "created",
+        "msecs",
+        "relativeCreated",
+        "thread",
+        "threadName",
+        "processName",
+        "process",
+    }
+)
+
 
 class JsonFormatter(logging.Formatter):
     """Format ``LogRecord`` instances as JSON strings.
@@ -39,41 +76,39 @@ class JsonFormatter(logging.Formatter):
         #   attributes set on the record (for example via ``LoggerAdapter``)
         #   are copied into the dictionary, except for internal
         #   attributes and metadata that are not useful for log analysis.
+        # Extra context first, then the four standard fields. time.gmtime
+        # avoids constructing a datetime object per record.
         record_dict: Dict[str, Any] = {
-            "timestamp": datetime.utcfromtimestamp(record.created).strftime("%Y-%m-%dT%H:%M:%SZ"),
-            "level": record.levelname,
-            "name": record.name,
-            "message": record.getMessage(),
+            key: value
+            for key, value in record.__dict__.items()
+            if not key.startswith("_") and key not in _RESERVED
         }
-        # Attach extra context
-        for key, value in record.__dict__.items():
-            if key.startswith("_"):
-                continue
-            if key in {
-                "args",
-                "msg",
-                "message",
-                "levelname",
-                "levelno",
-                "pathname",
-                "filename",
-                "module",
-                "exc_info",
-                "exc_text",
-                "stack_info",
-                "lineno",
-                "funcName",
-                "created",
-                "msecs",
-                "relativeCreated",
-                "thread",
-                "threadName",
-                "processName",
-                "process",
-            }:
-                continue
-            record_dict[key] = value
-        return json.dumps(record_dict)
+        record_dict["timestamp"] = time.strftime(
+            "%Y-%m-%dT%H:%M:%SZ", time.gmtime(record.created)
+        )
+        record_dict["level"] = record.levelname
+        record_dict["name"] = record.name
+        record_dict["message"] = record.getMessage()
+        if orjson is not None:
+            return orjson.dumps(record_dict, default=str).decode("utf-8")
+        return json.dumps(record_dict, default=str)
+
+
+class _RunIdFilter(logging.Filter):
+    """Stamp every record with the pipeline run identifier.
+
+    Unlike a ``LoggerAdapter``, a handler-level filter adds no Python
+    frame or dict allocation to each logging call on the caller side;
+    the attribute is set once per record just before formatting.
+    """
+
+    def __init__(self, run_id: str) -> None:
+        super().__init__()
+        self.run_id = run_id
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: A003
+        record.run_id = self.run_id
+        return True
 
 
 def setup_logging(log_file: Optional[str] = None, run_id: Optional[str] = None) -> logging.Logger:
@@ -85,10 +120,10 @@ def setup_logging(log_file: Optional[str] = None, run_id: Optional[str] = None)
         Optional path to a file where logs should be written. When
         ``None``, logs are only emitted to STDOUT.
     run_id: Optional[str]
-        Identifier attached to every log record via a ``LoggerAdapter``. This
-        correlation ID simplifies tracing across modules and functions and
-        aligns with the recommendation to use contextual logging
-        adapters【713027300398110†L968-L1031】.
+        Identifier attached to every log record via a handler-level
+        ``logging.Filter``. This correlation ID simplifies tracing across
+        modules and functions and aligns with the recommendation to use
+        contextual logging【713027300398110†L968-L1031】.
 
     Returns
     -------
@@ -100,10 +135,10 @@ def setup_logging(log_file: Optional[str] = None, run_id: Optional[str] = None)
     #   JSON formatted logs. It removes any existing handlers to avoid
     #   duplicate messages, adds a stream handler for STDOUT and
     #   conditionally adds a file handler if a file path is provided.
-    #   When a ``run_id`` is supplied, the logger is wrapped in a
-    #   ``LoggerAdapter`` so that the run identifier is included on
-    #   every emitted record. The configured logger is returned for
-    #   further use.
+    #   When a ``run_id`` is supplied, a ``_RunIdFilter`` is attached to
+    #   each handler so that the run identifier is included on every
+    #   emitted record without wrapping the logger in an adapter. The
+    #   configured logger is returned for further use.
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     # Remove existing handlers to avoid duplicate logs when reinitializing
@@ -111,16 +146,19 @@ def setup_logging(log_file: Optional[str] = None, run_id: Optional[str] = None)
         logger.handlers.pop()
 
     formatter = JsonFormatter()
+    run_id_filter = _RunIdFilter(run_id) if run_id else None
+
     stream_handler = logging.StreamHandler(sys.stdout)
     stream_handler.setFormatter(formatter)
+    if run_id_filter:
+        stream_handler.addFilter(run_id_filter)
     logger.addHandler(stream_handler)
 
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
+        if run_id_filter:
+            file_handler.addFilter(run_id_filter)
         logger.addHandler(file_handler)
 
-    # Wrap with LoggerAdapter to add run_id to log records
-    if run_id:
-        return logging.LoggerAdapter(logger, {"run_id": run_id})  # type: ignore[return-value]
     return logger
\ No newline at end of file
@@ -9,87 +9,89 @@ outputs thanks to seeded randomness and deterministic operations.
 
 Reliability and observability are core concerns. Logs include a
 ``run_id`` correlation identifier and timings for each stage. Data
-quality tests powered by Great Expectations enforce that the
-engineered feature table satisfies expected constraints before any
-recommendations are persisted. A failure in the expectations will
-abort the pipeline and raise a descriptive exception.
+quality checks enforce that the engineered feature table satisfies
+expected constraints before any recommendations are persisted. A
+failure in the checks will abort the pipeline and raise a descriptive
+exception.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-import great_expectations as gx  # type: ignore
 import pandas as pd
 
+from . import io
 from .assign import assign_perks
 from .config import Settings
-from .io import load_raw_data, write_csv
 from .logging import setup_logging
-from .reporting import (
-    generate_pdf_report,
-    write_perks_csv,
-    write_users_features_csv,
-)
+from .reporting import generate_pdf_report, write_perks_csv, write_users_features
 from .segment import cluster_users
 from .schemas import UserFeatures
-from .transform import clean_tables, engineer_features, filter_cohort
+from .transform import (
+    clean_tables,
+    engineer_features,
+    engineer_features_fast,
+    filter_cohort,
+)
+
+# Above this many cohort sessions the single-pass NumPy aggregation in
+# engineer_features_fast beats the groupby/merge implementation; below it the
+# difference is noise and the simpler code path is preferred.
+_FAST_FEATURES_THRESHOLD = 200_000
+
+
+def _input_hash(*frames: pd.DataFrame) -> str:
+    """Return a stable digest of the given DataFrames' contents.
+
+    Used to key the engineered-features checkpoint: when none of the
+    filtered input tables changed between runs, the heavy feature
+    computation can be skipped and the checkpoint reloaded instead.
+    """
+    digest = hashlib.sha1()
+    for df in frames:
+        digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return digest.hexdigest()
 
 
 def validate_features(features: pd.DataFrame) -> None:
-    """Validate the engineered features using Great Expectations.
+    """Validate the engineered features with vectorised pandas checks.
 
     Expect that user_id is non‑null and unique, total_sessions and
     total_bookings are non‑negative integers, total_nights is a
     non‑negative integer and avg_discount_rate is between 0 and 1.
 
-    A failure in any expectation will raise a ``great_expectations``
-    ``ExpectationValidationError``.
+    A failure in any check raises a ``ValueError`` summarising every
+    violated constraint.
     """
     # Notes:
-    #   This function sets up an in‑memory Great Expectations context
-    #   and defines a suite of expectations to validate the feature
-    #   DataFrame. It checks for non‑null and unique ``user_id`` values,
-    #   non‑negative session, booking and night counts and ensures
-    #   the discount rate is bounded between 0 and 1. If the
-    #   validation fails the function raises an exception which
-    #   halts the pipeline. Users can extend or modify these
-    #   expectations by editing this function.
-    # Create an in‑memory DataFrame asset
-    context = gx.get_context()
-    datasource = context.sources.add_pandas(name="mem")
-    asset = datasource.add_dataframe_asset("features", dataframe=features)
-    suite = asset.add_expectation_suite("feature_suite")
-    suite.add_expectation(
-        expectation_type="expect_column_values_to_not_be_null",
-        kwargs={"column": "user_id"},
-    )
-    suite.add_expectation(
-        expectation_type="expect_column_values_to_be_unique",
-        kwargs={"column": "user_id"},
-    )
+    #   Each constraint is evaluated as a single vectorised sweep over
+    #   the relevant column, so validation costs milliseconds rather
+    #   than the seconds a full expectation-suite framework spends on
+    #   context setup. Failures are collected into one summary dict so
+    #   a single run surfaces every violated constraint at once. Users
+    #   can extend or modify these checks by editing this function.
+    failures = {}
+    if not features["user_id"].notna().all():
+        failures["user_id_not_null"] = int(features["user_id"].isna().sum())
+    if not features["user_id"].is_unique:
+        failures["user_id_unique"] = int(features["user_id"].duplicated().sum())
     for col in ["total_sessions", "total_bookings", "total_nights"]:
-        suite.add_expectation(
-            expectation_type="expect_column_values_to_be_between",
-            kwargs={"column": col, "min_value": 0},
-        )
-    suite.add_expectation(
-        expectation_type="expect_column_values_to_be_between",
-        kwargs={"column": "avg_discount_rate", "min_value": 0.0, "max_value": 1.0},
-    )
-    # Run the validation
-    validator = context.get_validator(
-        batch_request=asset.build_batch_request(), expectation_suite=suite
-    )
-    result = validator.validate()
-    if not result.validation_success:
-        raise gx.exceptions.ExpectationValidationError(
-            "Feature validation failed", validation_result=result
-        )
+        negatives = int((features[col].to_numpy() < 0).sum())
+        if negatives:
+            failures[f"{col}_non_negative"] = negatives
+    rates = features["avg_discount_rate"].to_numpy()
+    out_of_range = int((~((rates >= 0.0) & (rates <= 1.0))).sum())
+    if out_of_range:
+        failures["avg_discount_rate_between_0_and_1"] = out_of_range
+    if failures:
+        raise ValueError(f"Feature validation failed: {failures}")
 
 
 def execute_pipeline(settings: Optional[Settings] = None) -> pd.DataFrame:
@@ -127,8 +129,20 @@ def execute_pipeline(settings: Optional[Settings] = None) -> pd.DataFrame:
     start_time = time.perf_counter()
     logger.info("Starting Travel Perks pipeline", extra={"stage": "start"})
 
-    # Load raw data
-    raw = load_raw_data(settings)
+    # Optionally accelerate scikit-learn with the Intel extension. The patch
+    # must be applied before sklearn estimators are imported, which is why
+    # cluster_users defers its sklearn import until call time.
+    if settings.use_sklearnex:
+        try:
+            from sklearnex import patch_sklearn
+
+            patch_sklearn()
+            logger.info("Patched scikit-learn with sklearnex")
+        except ImportError:
+            logger.warning("use_sklearnex is set but sklearnex is not installed; using stock scikit-learn")
+
+    # Load raw data (resolved through the io module so tests can stub it)
+    raw = io.load_raw_data(settings)
 
     # Clean tables
     users_c, sessions_c, flights_c, hotels_c = clean_tables(
@@ -140,28 +154,59 @@ def execute_pipeline(settings: Optional[Settings] = None) -> pd.DataFrame:
         users_c, sessions_c, settings.min_sessions, settings.start_date
     )
 
-    # Engineer features
-    features = engineer_features(users_filt, sessions_filt, flights_c, hotels_c)
+    # Engineer features; when the filtered inputs are unchanged since a
+    # previous run, reload the checkpointed result instead of recomputing.
+    # Dry runs never touch the checkpoint so they stay side-effect free.
+    features = None
+    checkpoint_path = None
+    if not settings.dry_run:
+        checkpoint_path = settings.gold_dir / (
+            f"features_{_input_hash(users_filt, sessions_filt, flights_c, hotels_c)}.parquet"
+        )
+        if checkpoint_path.exists():
+            logger.info("Loading engineered features from checkpoint %s", checkpoint_path)
+            features = pd.read_parquet(checkpoint_path)
+    if features is None:
+        # Large cohorts take the single-pass NumPy path
+        if len(sessions_filt) > _FAST_FEATURES_THRESHOLD:
+            features = engineer_features_fast(users_filt, sessions_filt, flights_c, hotels_c)
+        else:
+            features = engineer_features(users_filt, sessions_filt, flights_c, hotels_c)
+        if checkpoint_path is not None:
+            features.to_parquet(checkpoint_path, compression="zstd", index=False)
+            logger.info("Checkpointed engineered features at %s", checkpoint_path)
     # Compute total bookings for each user
     # Clustering
     features, model = cluster_users(features, n_clusters=4, seed=settings.seed)
     # Assign perks
     features = assign_perks(features)
-    # Validate features with GE
+    # Validate features before persisting anything
     try:
         validate_features(features)
-    except gx.exceptions.ExpectationValidationError as exc:
+    except ValueError as exc:
         logger.error("Data quality checks failed: %s", exc)
         raise
 
     # Write outputs (if not dry run)
     if not settings.dry_run:
         perks_csv_path = settings.output_dir / f"perks_{settings.run_id}.csv"
-        users_features_path = settings.gold_dir / f"users_features_{settings.run_id}.csv"
+        users_features_path = settings.gold_dir / (
+            f"users_features_{settings.run_id}.{settings.gold_format}"
+        )
         pdf_path = settings.output_dir / f"report_{settings.run_id}.pdf"
-        write_perks_csv(features, perks_csv_path)
-        write_users_features_csv(features, users_features_path)
-        generate_pdf_report(features, pdf_path)
+        # The three artifacts depend only on the features frame, not on each
+        # other, so write them concurrently; the stage then costs as much as
+        # the slowest write instead of the sum of all three.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(write_perks_csv, features, perks_csv_path),
+                executor.submit(
+                    write_users_features, features, users_features_path, settings.gold_format
+                ),
+                executor.submit(generate_pdf_report, features, pdf_path),
+            ]
+            for future in futures:
+                future.result()
         logger.info(
             "Wrote outputs to %s and %s and generated report %s",
             perks_csv_path,
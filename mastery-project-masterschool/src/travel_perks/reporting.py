@@ -17,9 +17,41 @@ from typing import Dict
 import pandas as pd
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.platypus import SimpleDocTemplate, LongTable, Paragraph, Spacer, TableStyle
 from reportlab.lib import colors
 
+try:  # pyarrow's parallel C++ CSV writer is far faster than DataFrame.to_csv
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pragma: no cover - exercised only without pyarrow
+    pa = None  # type: ignore[assignment]
+    pacsv = None  # type: ignore[assignment]
+
+# getSampleStyleSheet() builds a couple of dozen ParagraphStyle objects in
+# Python loops; the sheet is immutable for our purposes, so build it once at
+# import rather than per report.
+_STYLES = getSampleStyleSheet()
+_TITLE = _STYLES["Title"]
+_BODY = _STYLES["BodyText"]
+
+
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write ``df`` to ``path`` as CSV via pyarrow, falling back to pandas.
+
+    ``DataFrame.to_csv`` formats each cell in Python and is CPU-bound
+    well below disk bandwidth; Arrow serializes the table in parallel
+    C++ instead. The pandas writer remains as a fallback when pyarrow
+    is unavailable.
+    """
+    if pacsv is not None:
+        pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), str(path))
+    else:
+        # A 1 MiB buffer instead of the ~8 KiB default cuts write()
+        # syscalls by two orders of magnitude, which matters on
+        # network-mounted output directories.
+        with open(path, "w", buffering=1 << 20, newline="") as handle:
+            df.to_csv(handle, index=False)
+
 
 def write_perks_csv(features: pd.DataFrame, path: Path) -> None:
     """Write the final perks assignment to a CSV file.
@@ -42,7 +74,7 @@ def write_perks_csv(features: pd.DataFrame, path: Path) -> None:
     cols = ["user_id", "cluster_id", "perk"]
     subset = features[cols]
     path.parent.mkdir(parents=True, exist_ok=True)
-    subset.to_csv(path, index=False)
+    _write_csv(subset, path)
 
 
 def write_users_features_csv(features: pd.DataFrame, path: Path) -> None:
@@ -62,7 +94,35 @@ def write_users_features_csv(features: pd.DataFrame, path: Path) -> None:
     #   Downstream analytics or dashboards can read this file to
     #   perform deeper analysis of user segments.
     path.parent.mkdir(parents=True, exist_ok=True)
-    features.to_csv(path, index=False)
+    _write_csv(features, path)
+
+
+def write_users_features(features: pd.DataFrame, path: Path, fmt: str = "parquet") -> None:
+    """Write the gold (aggregated features) table in the given format.
+
+    CSV is the slowest option for both disk footprint and re-reading;
+    downstream analytics reload this table, so columnar formats are
+    preferred: Feather for the fastest reload, Parquet (zstd) for the
+    smallest archival footprint.
+
+    Parameters
+    ----------
+    features: pandas.DataFrame
+        DataFrame containing engineered features, cluster IDs and perks.
+    path: pathlib.Path
+        Destination file.
+    fmt: str, default ``"parquet"``
+        One of ``"parquet"``, ``"feather"`` or ``"csv"``.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        features.to_parquet(path, compression="zstd", index=False)
+    elif fmt == "feather":
+        features.reset_index(drop=True).to_feather(path)
+    elif fmt == "csv":
+        _write_csv(features, path)
+    else:
+        raise ValueError(f"Unsupported gold format: {fmt!r}")
 
 
 def generate_pdf_report(features: pd.DataFrame, path: Path) -> None:
@@ -90,12 +150,11 @@ def generate_pdf_report(features: pd.DataFrame, path: Path) -> None:
     logger = logging.getLogger(__name__)
     logger.info("Generating PDF report at %s", path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    styles = getSampleStyleSheet()
     doc = SimpleDocTemplate(path, pagesize=letter)
     story = []
 
     # Title
-    story.append(Paragraph("Travel Perks Recommendation Report", styles["Title"]))
+    story.append(Paragraph("Travel Perks Recommendation Report", _TITLE))
     story.append(Spacer(1, 12))
 
     # Summary paragraph
@@ -104,17 +163,33 @@ def generate_pdf_report(features: pd.DataFrame, path: Path) -> None:
         Paragraph(
             f"This report summarises the distribution of {total_users} users "
             "across the configured perk recommendations.",
-            styles["BodyText"],
+            _BODY,
         )
     )
     story.append(Spacer(1, 12))
 
-    # Perk counts table
-    counts = features["perk"].value_counts().reset_index()
+    # Perk counts table. groupby.size() counts in a single pass without the
+    # index-rename detour value_counts() takes; observed=True keeps the
+    # optimised path when perk is categorical. The final sort over a handful
+    # of perk rows restores the descending-by-count presentation readers of
+    # the report expect.
+    counts = (
+        features.groupby("perk", sort=False, observed=True)
+        .size()
+        .rename("User Count")
+        .reset_index()
+        .sort_values("User Count", ascending=False, ignore_index=True)
+    )
     counts.columns = ["Perk", "User Count"]
     counts["Share"] = (counts["User Count"] / total_users).round(3)
-    data = [["Perk", "User Count", "Share"]] + counts.values.tolist()
-    table = Table(data, hAlign="LEFT")
+    # LongTable lays rows out in a single O(n) pass instead of Table's
+    # retry-pagination loop, so the report stays cheap if it ever grows
+    # beyond the perk summary. Cells are pre-stringified so ReportLab does
+    # not fall back to per-cell Paragraph wrapping for numeric values.
+    data = [["Perk", "User Count", "Share"]] + [
+        [str(cell) for cell in row] for row in counts.itertuples(index=False)
+    ]
+    table = LongTable(data, hAlign="LEFT", repeatRows=1)
     table.setStyle(
         TableStyle(
             [
@@ -10,18 +10,26 @@ may use the ``cluster_id`` column to assign perks.
 from __future__ import annotations
 
 import logging
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
 import numpy as np
 import pandas as pd
-from sklearn.cluster import KMeans
+
+if TYPE_CHECKING:  # pragma: no cover - import for type hints only
+    from sklearn.base import ClusterMixin
+
+
+# Above this many users, full-batch KMeans iterations become expensive and
+# MiniBatchKMeans (on standardised float32 features) converges to comparable
+# segments at a fraction of the cost. Small cohorts keep exact KMeans.
+_MINIBATCH_THRESHOLD = 50_000
 
 
 def cluster_users(
     features: pd.DataFrame,
     n_clusters: int = 4,
     seed: int = 42,
-) -> Tuple[pd.DataFrame, KMeans]:
+) -> Tuple[pd.DataFrame, "ClusterMixin"]:
     """Apply k‑means clustering to user features.
 
     Parameters
@@ -36,29 +44,60 @@ def cluster_users(
 
     Returns
     -------
-    tuple of (pandas.DataFrame, sklearn.cluster.KMeans)
+    tuple of (pandas.DataFrame, cluster model)
         The input DataFrame augmented with a ``cluster_id`` column and
-        the fitted KMeans model.
+        the fitted model (``KMeans`` for small cohorts,
+        ``MiniBatchKMeans`` above the mini-batch threshold).
     """
     # Notes:
     #   The function first selects all numeric columns excluding
     #   identifiers (``user_id`` and ``cluster_id``) and converts them
-    #   into a NumPy array. It then instantiates a ``KMeans`` model
-    #   with the given number of clusters and a fixed random seed for
-    #   reproducibility. After fitting the model, it appends the
-    #   resulting cluster labels to the DataFrame and returns both
-    #   the augmented DataFrame and the fitted model. Logging
-    #   statements provide basic progress messages.
+    #   into a NumPy array. Small cohorts are clustered with exact
+    #   ``KMeans`` for fully deterministic assignments; large cohorts
+    #   are standardised (so that differently scaled features such as
+    #   total_nights and avg_discount_rate contribute comparably) and
+    #   clustered with ``MiniBatchKMeans``, whose per-step cost depends
+    #   on the batch size rather than the cohort size. A fixed random
+    #   seed keeps both paths reproducible. After fitting the model,
+    #   the resulting cluster labels are appended to the DataFrame and
+    #   both the augmented DataFrame and the fitted model are returned.
+    # Imported here rather than at module load so that an sklearnex patch
+    # applied by the pipeline before clustering takes effect on these names.
+    from sklearn.cluster import KMeans, MiniBatchKMeans
+    from sklearn.preprocessing import StandardScaler
+
     logger = logging.getLogger(__name__)
+    if n_clusters > len(features):
+        logger.warning(
+            "Requested %s clusters but only %s users are available; clamping",
+            n_clusters,
+            len(features),
+        )
+        n_clusters = len(features)
     logger.info("Clustering %s users into %s segments", len(features), n_clusters)
-    # Select numerical columns for clustering
-    numeric_cols = features.select_dtypes(include=[np.number]).columns.tolist()
-    # Exclude identifier columns
-    numeric_cols = [c for c in numeric_cols if c not in {"user_id", "cluster_id"}]
-    data = features[numeric_cols].to_numpy()
-    model = KMeans(n_clusters=n_clusters, random_state=seed, n_init="auto")
+    # Select numerical columns for clustering. Filtering the dtypes mapping
+    # directly skips the intermediate DataFrame select_dtypes would build;
+    # identifier columns are excluded by name.
+    numeric_cols = [
+        c
+        for c, dt in features.dtypes.items()
+        if isinstance(dt, np.dtype)  # extension dtypes cannot be numeric here
+        and np.issubdtype(dt, np.number)
+        and c not in ("user_id", "cluster_id")
+    ]
+    # A contiguous float32 array halves the bytes the distance kernels touch
+    # and avoids scikit-learn's internal validation copy.
+    data = np.ascontiguousarray(features[numeric_cols].to_numpy(), dtype=np.float32)
+    if len(features) > _MINIBATCH_THRESHOLD:
+        data = StandardScaler().fit_transform(data)
+        model = MiniBatchKMeans(
+            n_clusters=n_clusters, random_state=seed, batch_size=4096, n_init=3
+        )
+    else:
+        model = KMeans(n_clusters=n_clusters, random_state=seed, n_init="auto")
     labels = model.fit_predict(data)
-    features_with_cluster = features.copy()
-    features_with_cluster["cluster_id"] = labels
+    # assign() shares the existing column buffers and only allocates the
+    # new cluster_id column, rather than deep-copying the whole frame.
+    features_with_cluster = features.assign(cluster_id=labels.astype(np.int32))
     logger.info("Finished clustering")
     return features_with_cluster, model
\ No newline at end of file
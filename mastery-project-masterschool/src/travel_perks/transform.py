@@ -12,12 +12,47 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Tuple
 
 import numpy as np
 import pandas as pd
 
 
+def _parse_dates(series: pd.Series) -> pd.Series:
+    """Parse a date column to ``datetime64``, ISO fast path first.
+
+    Categorical input is unwrapped to plain values up front —
+    ``to_datetime`` would otherwise return a categorical with datetime
+    categories, which breaks every downstream comparison and
+    subtraction. The explicit ISO8601 format skips pandas' per-value
+    format inference; values that are not strictly ISO fall back to the
+    flexible parser so they are still parsed rather than silently
+    coerced to NaT, and only truly invalid dates become NaT.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(series.cat.categories.dtype)
+    try:
+        return pd.to_datetime(series, format="ISO8601", cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(series, errors="coerce", cache=True)
+
+
+def _discount_rate(df: pd.DataFrame) -> pd.Series:
+    """Per-booking discount rate with zero totals mapped to NaN.
+
+    The booking schemas are fixed, so the column names are hard-wired
+    and the zero guard is a single ``np.where`` over the raw array
+    rather than a ``.replace`` mapping pass. Raises ``KeyError`` when a
+    table is missing the discount columns; callers treat that as "no
+    discount data".
+    """
+    amounts = df["total_amount"].to_numpy(dtype="float64")
+    rates = df["discount_amount"].to_numpy(dtype="float64") / np.where(
+        amounts == 0, np.nan, amounts
+    )
+    return pd.Series(rates, index=df.index)
+
+
 def clean_tables(
     users: pd.DataFrame, sessions: pd.DataFrame, flights: pd.DataFrame, hotels: pd.DataFrame
 ) -> Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
@@ -42,23 +77,24 @@ def clean_tables(
     """
     # Notes:
     #   This function performs a series of non‑destructive cleaning
-    #   operations. Column names are normalised to lower case and
-    #   duplicates are removed to simplify downstream processing.
-    #   Known date columns are converted to pandas datetime objects
-    #   using ``pd.to_datetime`` with ``errors='coerce'`` so that
-    #   invalid dates become NaT rather than raising exceptions.
+    #   operations. Column names are normalised to lower case via
+    #   ``rename`` (which only rebuilds the column index, not the data
+    #   buffers) and duplicates are removed to simplify downstream
+    #   processing. Known date columns are converted to pandas datetime
+    #   objects via ``_parse_dates``: an ISO8601 fast path with a
+    #   flexible-parser fallback, so invalid dates become NaT rather
+    #   than raising exceptions; ``cache=True`` deduplicates repeated
+    #   date strings before parsing.
     logger = logging.getLogger(__name__)
     logger.info("Cleaning raw tables")
 
     def _std_cols(df: pd.DataFrame) -> pd.DataFrame:
-        df = df.copy()
-        df.columns = [c.strip().lower() for c in df.columns]
-        return df
+        return df.rename(columns=lambda c: c.strip().lower())
 
-    users_c = _std_cols(users).drop_duplicates()
-    sessions_c = _std_cols(sessions).drop_duplicates()
-    flights_c = _std_cols(flights).drop_duplicates()
-    hotels_c = _std_cols(hotels).drop_duplicates()
+    users_c = _std_cols(users).drop_duplicates(ignore_index=True)
+    sessions_c = _std_cols(sessions).drop_duplicates(ignore_index=True)
+    flights_c = _std_cols(flights).drop_duplicates(ignore_index=True)
+    hotels_c = _std_cols(hotels).drop_duplicates(ignore_index=True)
 
     # Convert known date columns to datetime
     for df, date_cols in [
@@ -68,7 +104,7 @@ def clean_tables(
     ]:
         for col in date_cols:
             if col in df.columns:
-                df[col] = pd.to_datetime(df[col], errors="coerce")
+                df[col] = _parse_dates(df[col])
 
     return users_c, sessions_c, flights_c, hotels_c
 
@@ -105,11 +141,14 @@ def filter_cohort(
     # Notes:
     #   Cohort filtering is based solely on session activity. First
     #   sessions are limited to those on or after the specified
-    #   start date. Then users with a session count greater than or
-    #   equal to ``min_sessions`` are retained. Both the users and
-    #   sessions DataFrames are subsetted to this qualifying set of
-    #   user_ids. This function does not modify flights or hotels
-    #   directly; they are filtered later when engineering features.
+    #   start date. Session counts per user come from a single
+    #   ``np.unique(..., return_counts=True)`` sweep over the raw id
+    #   array, and the qualifying-id membership tests use ``np.isin``
+    #   on NumPy views — both avoid building pandas hash tables per
+    #   call. Both the users and sessions DataFrames are subsetted to
+    #   this qualifying set of user_ids. This function does not modify
+    #   flights or hotels directly; they are filtered later when
+    #   engineering features.
     logger = logging.getLogger(__name__)
     logger.info(
         "Filtering users to those with at least %s sessions on or after %s",
@@ -121,14 +160,24 @@ def filter_cohort(
     except Exception as exc:
         raise ValueError(f"Invalid start_date {start_date}: {exc}") from exc
 
-    # Filter sessions to the time window
-    sessions_in_window = sessions.loc[
-        (sessions["session_start"].notna()) & (sessions["session_start"] >= cutoff)
-    ].copy()
-    counts = sessions_in_window.groupby("user_id").size().reset_index(name="session_count")
-    qualifying_users = counts.loc[counts["session_count"] >= min_sessions, "user_id"]
-    users_filt = users[users["user_id"].isin(qualifying_users)].copy()
-    sessions_filt = sessions[sessions["user_id"].isin(qualifying_users)].copy()
+    # Filter sessions to the time window and count sessions per user
+    in_window = sessions["session_start"].notna() & (sessions["session_start"] >= cutoff)
+    window_ids = sessions.loc[in_window, "user_id"].to_numpy()
+    unique_ids, session_counts = np.unique(window_ids, return_counts=True)
+    qualifying_users = unique_ids[session_counts >= min_sessions]
+    # Boolean indexing already materialises new frames, so no defensive
+    # .copy() is needed on top of it; the categorical recode below goes
+    # through assign(), which shares the untouched column buffers.
+    users_filt = users[np.isin(users["user_id"].to_numpy(), qualifying_users)]
+    sessions_filt = sessions[np.isin(sessions["user_id"].to_numpy(), qualifying_users)]
+    # Encode user_id as a categorical with the cohort's ids as shared
+    # categories: every downstream groupby then reuses the precomputed
+    # integer codes instead of rebuilding a hash table per aggregation.
+    cohort_cat = pd.Categorical(users_filt["user_id"])
+    users_filt = users_filt.assign(user_id=cohort_cat)
+    sessions_filt = sessions_filt.assign(
+        user_id=pd.Categorical(sessions_filt["user_id"], categories=cohort_cat.categories)
+    )
     logger.info("Selected %s users for the cohort", len(users_filt))
     return users_filt, sessions_filt
 
@@ -161,59 +210,178 @@ def engineer_features(
     """
     # Notes:
     #   Feature engineering aggregates behavioural data into a single
-    #   row per user. Session counts, booking counts and total nights
-    #   stayed are computed via groupby operations. Average discount
-    #   rate is calculated across both flights and hotels when
-    #   ``discount_amount`` and ``total_amount`` columns are present.
-    #   Missing values are filled with zeros to avoid NaNs, and
-    #   intermediate columns are dropped after computing the final
-    #   ``total_bookings`` feature.
+    #   row per user. Each aggregate is kept as a Series indexed by
+    #   user_id and the feature table is assembled with one
+    #   ``pd.concat(axis=1)`` — a pure index-alignment join — followed
+    #   by a single ``reindex`` onto the cohort's user ids. This
+    #   replaces the previous chain of five hash-based merges, each of
+    #   which allocated a new frame and rehashed the key column.
+    #   Average discount rate is calculated across both flights and
+    #   hotels when ``discount_amount`` and ``total_amount`` columns
+    #   are present. Missing values are filled with zeros to avoid
+    #   NaNs, and intermediate columns are dropped after computing the
+    #   final ``total_bookings`` feature.
     logger = logging.getLogger(__name__)
     logger.info("Engineering user‑level features")
 
-    # Sessions per user
-    sessions_counts = sessions.groupby("user_id").size().reset_index(name="total_sessions")
-
-    # Flight bookings per user
-    flights_counts = flights.groupby("user_id").size().reset_index(name="flight_bookings")
+    # When filter_cohort has encoded user_id as a categorical, recode the
+    # booking tables onto the same categories so their groupbys also run on
+    # integer codes; ids outside the cohort become NaN and drop out of the
+    # aggregates (the old merge-based restriction, done up front).
+    uid_dtype = users["user_id"].dtype
+    if isinstance(uid_dtype, pd.CategoricalDtype):
+        categories = uid_dtype.categories
+        flights = flights.assign(user_id=pd.Categorical(flights["user_id"], categories=categories))
+        hotels = hotels.assign(user_id=pd.Categorical(hotels["user_id"], categories=categories))
 
-    # Hotel bookings per user
-    hotels_counts = hotels.groupby("user_id").size().reset_index(name="hotel_bookings")
+    # Per-user aggregates, each a Series indexed by user_id
+    total_sessions = sessions.groupby("user_id", observed=True).size().rename("total_sessions")
+    flight_bookings = flights.groupby("user_id", observed=True).size().rename("flight_bookings")
+    hotel_bookings = hotels.groupby("user_id", observed=True).size().rename("hotel_bookings")
 
-    # Total nights from hotel stays
+    # Total nights from hotel stays; the derived Series is grouped by the
+    # hotels table's own user_id column, so no frame copy is needed. The
+    # subtraction runs on int64 views of the datetime64[ns] columns — one
+    # vectorised subtract and integer divide, with no timedelta
+    # materialisation or .dt accessor overhead. NaT encodes as the int64
+    # minimum, so stays with a missing date are masked to zero nights
+    # (matching the NaN-skipping sum of the previous implementation).
     if {"check_in", "check_out"}.issubset(hotels.columns):
-        hotels_nights = hotels.copy()
-        hotels_nights["nights"] = (
-            (hotels_nights["check_out"] - hotels_nights["check_in"]).dt.days.clip(lower=0)
+        check_out = hotels["check_out"].to_numpy().view("i8")
+        check_in = hotels["check_in"].to_numpy().view("i8")
+        nat = np.iinfo("i8").min
+        valid = (check_out != nat) & (check_in != nat)
+        nights_arr = np.where(
+            valid, np.maximum((check_out - check_in) // 86_400_000_000_000, 0), 0
         )
-        nights_per_user = hotels_nights.groupby("user_id")["nights"].sum().reset_index(name="total_nights")
+        nights = pd.Series(nights_arr, index=hotels.index)
+        total_nights = nights.groupby(hotels["user_id"], observed=True).sum().rename("total_nights")
     else:
-        nights_per_user = pd.DataFrame({"user_id": [], "total_nights": []})
+        total_nights = pd.Series(dtype="float64", name="total_nights")
 
-    # Discount rates from bookings (assumes discount_amount and total_amount columns exist)
-    discount_frames: Iterable[pd.DataFrame] = []
+    # Discount rates from bookings, computed by the specialised module-level
+    # helper — bare Series, no intermediate frame allocations — and averaged
+    # across both tables in one groupby. A table missing the discount
+    # columns (schema drift) simply contributes no rates.
+    discount_ids = []
+    discount_rates = []
     for df in [flights, hotels]:
-        if {"discount_amount", "total_amount", "user_id"}.issubset(df.columns):
-            tmp = df.copy()
-            tmp["discount_rate"] = tmp["discount_amount"] / tmp["total_amount"].replace({0: np.nan})
-            discount_frames.append(tmp[["user_id", "discount_rate"]])
-    if discount_frames:
-        discounts = pd.concat(discount_frames)
-        avg_discount = discounts.groupby("user_id")["discount_rate"].mean().reset_index(
-            name="avg_discount_rate"
-        )
+        try:
+            rates = _discount_rate(df)
+            discount_ids.append(df["user_id"])
+        except KeyError:
+            continue
+        discount_rates.append(rates)
+    if discount_rates:
+        # copy=False skips the consolidation copy of the concatenated
+        # buffers; the combined Series feed straight into a groupby and
+        # are never mutated.
+        ids = pd.concat(discount_ids, ignore_index=True, copy=False)
+        rates = pd.concat(discount_rates, ignore_index=True, copy=False)
+        avg_discount = rates.groupby(ids, observed=True).mean().rename("avg_discount_rate")
     else:
-        avg_discount = pd.DataFrame({"user_id": [], "avg_discount_rate": []})
-
-    # Merge all features
-    features = users[["user_id"]].drop_duplicates().copy()
-    for df in [sessions_counts, flights_counts, hotels_counts, nights_per_user, avg_discount]:
-        features = features.merge(df, on="user_id", how="left")
-    # Replace NaNs with zeros
-    features = features.fillna(0)
+        avg_discount = pd.Series(dtype="float64", name="avg_discount_rate")
+
+    # One column-wise concat on the shared user_id index, then one reindex
+    # onto the cohort; users without activity in a table get zeros.
+    features = (
+        pd.concat(
+            [total_sessions, flight_bookings, hotel_bookings, total_nights, avg_discount],
+            axis=1,
+        )
+        .reindex(users["user_id"].unique())
+        .fillna(0)
+        .rename_axis("user_id")
+        .reset_index()
+    )
     # Calculate total bookings (flights + hotels)
     features["total_bookings"] = features["flight_bookings"] + features["hotel_bookings"]
     # Drop intermediate columns
     features = features.drop(columns=["flight_bookings", "hotel_bookings"], errors="ignore")
+    # The categorical encoding was a groupby optimisation; emit plain ids
+    # so downstream consumers and file formats see the original dtype.
+    if isinstance(uid_dtype, pd.CategoricalDtype):
+        features["user_id"] = features["user_id"].astype(categories.dtype)
+    logger.info("Generated feature table with %s users", len(features))
+    return features
+
+
+def engineer_features_fast(
+    users: pd.DataFrame, sessions: pd.DataFrame, flights: pd.DataFrame, hotels: pd.DataFrame
+) -> pd.DataFrame:
+    """Compute the same features as :func:`engineer_features` in single passes.
+
+    Instead of one groupby per aggregate plus a chain of merges, each
+    base table is traversed exactly once: user ids are mapped to dense
+    codes against the cohort index and every aggregate is accumulated
+    with ``np.bincount``. This keeps the whole computation in a handful
+    of vectorised NumPy sweeps, which pays off on large cohorts where
+    per-groupby hashing dominates. Semantics match
+    :func:`engineer_features`; only result dtypes may be narrower
+    because no NaN-introducing merges occur.
+
+    Parameters
+    ----------
+    users, sessions, flights, hotels : pandas.DataFrame
+        Same inputs as :func:`engineer_features`.
+
+    Returns
+    -------
+    pandas.DataFrame
+        Aggregated user features, one row per user_id.
+    """
+    # Notes:
+    #   ``uid_index.get_indexer`` maps each row's user_id to a dense
+    #   code in [0, n) (or -1 for users outside the cohort, which are
+    #   dropped). ``np.bincount`` then accumulates counts and weighted
+    #   sums per code. Rows whose discount rate is undefined (zero or
+    #   missing total_amount) are excluded from the average, mirroring
+    #   the NaN handling of the groupby path.
+    logger = logging.getLogger(__name__)
+    logger.info("Engineering user‑level features (fast path)")
+
+    # np.asarray unwraps a categorical user_id (see filter_cohort) back to
+    # its plain values; the dense codes are rebuilt below anyway.
+    uid_index = pd.Index(np.asarray(users["user_id"].unique()))
+    n = len(uid_index)
+
+    def _counts(df: pd.DataFrame) -> np.ndarray:
+        codes = uid_index.get_indexer(df["user_id"])
+        return np.bincount(codes[codes >= 0], minlength=n)
+
+    total_sessions = _counts(sessions)
+    flight_bookings = _counts(flights)
+    hotel_bookings = _counts(hotels)
+
+    if {"check_in", "check_out"}.issubset(hotels.columns):
+        codes = uid_index.get_indexer(hotels["user_id"])
+        nights = (hotels["check_out"] - hotels["check_in"]).dt.days.clip(lower=0).to_numpy(
+            dtype="float64", na_value=0.0
+        )
+        mask = codes >= 0
+        total_nights = np.bincount(codes[mask], weights=nights[mask], minlength=n)
+    else:
+        total_nights = np.zeros(n)
+
+    rate_sum = np.zeros(n)
+    rate_cnt = np.zeros(n)
+    for df in [flights, hotels]:
+        if {"discount_amount", "total_amount", "user_id"}.issubset(df.columns):
+            codes = uid_index.get_indexer(df["user_id"])
+            rates = _discount_rate(df).to_numpy()
+            mask = (codes >= 0) & ~np.isnan(rates)
+            rate_sum += np.bincount(codes[mask], weights=rates[mask], minlength=n)
+            rate_cnt += np.bincount(codes[mask], minlength=n)
+    avg_discount = np.divide(rate_sum, rate_cnt, out=np.zeros(n), where=rate_cnt > 0)
+
+    features = pd.DataFrame(
+        {
+            "user_id": uid_index.to_numpy(),
+            "total_sessions": total_sessions,
+            "total_nights": total_nights.astype("int64"),
+            "avg_discount_rate": avg_discount,
+            "total_bookings": flight_bookings + hotel_bookings,
+        }
+    )
     logger.info("Generated feature table with %s users", len(features))
     return features
\ No newline at end of file
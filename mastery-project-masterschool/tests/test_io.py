@@ -7,7 +7,8 @@ from pathlib import Path
 
 import pandas as pd
 
-from travel_perks.io import read_csv, write_csv
+from travel_perks.io import _USECOLS, read_csv, write_csv
+from travel_perks.transform import clean_tables, filter_cohort
 
 
 def test_read_write_csv(tmp_path):
@@ -18,4 +19,34 @@ def test_read_write_csv(tmp_path):
     write_csv(df, out_path)
     # Read back using read_csv via file URI
     loaded = read_csv(out_path.as_uri())
-    pd.testing.assert_frame_equal(df, loaded)
\ No newline at end of file
+    pd.testing.assert_frame_equal(df, loaded)
+
+
+def test_raw_csv_dates_survive_categorization(tmp_path):
+    """Raw date strings must stay parseable through ingest categorization.
+
+    Day-granularity date strings repeat heavily and would pass the
+    cardinality test for category encoding; the row count here exceeds
+    the ``to_datetime`` cache threshold so a categorical date column
+    would surface as a categorical after parsing and break cohort
+    filtering.
+    """
+    n = 120
+    sessions = pd.DataFrame(
+        {
+            "session_id": range(n),
+            "user_id": [i % 10 for i in range(n)],
+            "session_start": ["2023-02-01T10:00:00"] * n,
+            "session_end": ["2023-02-01T11:00:00"] * n,
+        }
+    )
+    path = tmp_path / "sessions.csv"
+    sessions.to_csv(path, index=False)
+    raw_sessions = read_csv(str(path), categorize=True, usecols=_USECOLS["sessions"])
+    users = pd.DataFrame({"user_id": range(10)})
+    empty = pd.DataFrame({"user_id": []})
+    users_c, sessions_c, _, _ = clean_tables(users, raw_sessions, empty, empty)
+    assert sessions_c["session_start"].dtype == "datetime64[ns]"
+    users_filt, sessions_filt = filter_cohort(users_c, sessions_c, 1, "2023-01-01")
+    assert len(users_filt) == 10
+    assert len(sessions_filt) == n
\ No newline at end of file
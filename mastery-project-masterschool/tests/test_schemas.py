@@ -0,0 +1,29 @@
+"""Tests for schema validation."""
+
+import pandas as pd
+import pytest
+
+from travel_perks.schemas import UserFeatures
+
+
+def _frame(**overrides):
+    data = {
+        "user_id": [1, 2],
+        "total_sessions": [3, 5],
+        "total_bookings": [1, 2],
+        "total_nights": [2, 0],
+        "avg_discount_rate": [0.1, float("nan")],
+    }
+    data.update(overrides)
+    return pd.DataFrame(data)
+
+
+def test_validate_frame_coerces_nan_discount():
+    validated = UserFeatures.validate_frame(_frame())
+    assert validated["avg_discount_rate"].tolist() == [0.1, 0.0]
+
+
+def test_validate_frame_raises_on_violations():
+    bad = _frame(total_nights=[-1, 0], avg_discount_rate=[1.5, 0.2])
+    with pytest.raises(ValueError, match="total_nights_non_negative"):
+        UserFeatures.validate_frame(bad)
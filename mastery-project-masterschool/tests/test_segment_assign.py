@@ -33,4 +33,19 @@ def test_assign_perks():
         DEFAULT_PERK_MAPPING[1],
         DEFAULT_PERK_MAPPING[2],
         DEFAULT_PERK_MAPPING[3],
-    ]
\ No newline at end of file
+    ]
+
+
+def test_assign_perks_edge_cases():
+    # An empty mapping assigns "Unknown" everywhere
+    feats = pd.DataFrame({"cluster_id": [0, 1]})
+    assert list(assign_perks(feats, mapping={})["perk"]) == ["Unknown", "Unknown"]
+    # Float codes with NaN (e.g. a frame read back from disk) fall back to
+    # "Unknown" for the missing rows
+    feats = pd.DataFrame({"cluster_id": [0.0, float("nan")]})
+    result = assign_perks(feats)
+    assert list(result["perk"]) == [DEFAULT_PERK_MAPPING[0], "Unknown"]
+    # Negative cluster ids are honoured when the mapping defines them
+    feats = pd.DataFrame({"cluster_id": [-1, 0]})
+    result = assign_perks(feats, mapping={-1: "Outlier", 0: "Free checked bag"})
+    assert list(result["perk"]) == ["Outlier", "Free checked bag"]
\ No newline at end of file
@@ -4,7 +4,12 @@ from __future__ import annotations
 
 import pandas as pd
 
-from travel_perks.transform import clean_tables, engineer_features, filter_cohort
+from travel_perks.transform import (
+    clean_tables,
+    engineer_features,
+    engineer_features_fast,
+    filter_cohort,
+)
 
 
 def test_cohort_filter(sample_raw_data):
@@ -41,4 +46,17 @@ def test_engineer_features(sample_raw_data):
         "total_nights",
         "avg_discount_rate",
     }
-    assert expected_cols.issubset(feats.columns)
\ No newline at end of file
+    assert expected_cols.issubset(feats.columns)
+
+def test_engineer_features_fast_matches(sample_raw_data):
+    users_c, sessions_c, flights_c, hotels_c = clean_tables(
+        sample_raw_data["users"],
+        sample_raw_data["sessions"],
+        sample_raw_data["flights"],
+        sample_raw_data["hotels"],
+    )
+    users_filt, sessions_filt = filter_cohort(users_c, sessions_c, 1, "2023-01-01")
+    expected = engineer_features(users_filt, sessions_filt, flights_c, hotels_c)
+    fast = engineer_features_fast(users_filt, sessions_filt, flights_c, hotels_c)
+    # The fast path produces narrower dtypes but identical values
+    pd.testing.assert_frame_equal(fast, expected, check_dtype=False)